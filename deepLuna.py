@@ -1,7 +1,18 @@
 #!/usr/bin/env python3
+import logging
+import os
+
 from luna.ui.start_window import StartWindow
 
 def main():
+    # Per-line debug output is gated behind the logging level so the
+    # editor doesn't pay for console writes on every save by default.
+    # Accept any case and fall back to WARNING on an unknown name
+    # rather than crashing before the start window appears.
+    level = os.environ.get("DEEPLUNA_LOG", "").upper()
+    if level not in ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"):
+        level = "WARNING"
+    logging.basicConfig(level=level)
     StartWindow().mainloop()
 
 if __name__ == '__main__':
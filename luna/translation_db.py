@@ -42,6 +42,12 @@ class TranslationDb:
         self._overrides_by_offset = overrides_by_offset
         self._charswap_map = charswap_map or {}
 
+        # Running count of hash lines with a translation, maintained by
+        # set_translation_and_comment_for_hash so translated_percent
+        # never has to rescan the line map
+        self._translated_count = sum(
+            1 for line in line_by_hash.values() if line.en_text)
+
     def scene_names(self, include_empty=False):
         all_scenes = list(self._scene_map.keys())
         if include_empty:
@@ -60,8 +66,10 @@ class TranslationDb:
         return self._overrides_by_offset.get(offset)
 
     def set_translation_and_comment_for_hash(self, jp_hash, en_text, comment):
-        self._line_by_hash[jp_hash].en_text = en_text
-        self._line_by_hash[jp_hash].comment = comment
+        line = self._line_by_hash[jp_hash]
+        self._translated_count += int(bool(en_text)) - int(bool(line.en_text))
+        line.en_text = en_text
+        line.comment = comment
 
     def tl_line_for_cmd(self, cmd):
         return self.tl_override_for_offset(cmd.offset) or \
@@ -91,18 +99,42 @@ class TranslationDb:
         self._overrides_by_offset[offset].en_text = en_text
         self._overrides_by_offset[offset].comment = comment
 
+    def override_translations_bulk(self, updates):
+        """
+        Apply many offset overrides at once, where updates maps
+        offset -> (en_text, comment). Seeding a missing override needs
+        the jp hash at that offset, which the one-at-a-time path finds
+        with a full scene-map scan per call; here every missing offset
+        is resolved in a single pass.
+        """
+        missing = {
+            offset for offset in updates
+            if offset not in self._overrides_by_offset
+        }
+        if missing:
+            for scene in self._scene_map.values():
+                for line in scene:
+                    if line.offset in missing:
+                        jp_hash = line.jp_hash
+                        if jp_hash not in self._line_by_hash:
+                            print(f"Unknown hash {jp_hash}")
+                            continue
+                        self._overrides_by_offset[line.offset] = \
+                            copy.deepcopy(self._line_by_hash[jp_hash])
+
+        for offset, (en_text, comment) in updates.items():
+            override = self._overrides_by_offset.get(offset)
+            if override is None:
+                # Offset absent from the scene map / unknown hash
+                continue
+            override.en_text = en_text
+            override.comment = comment
+
     def clear_offset_overrides(self):
         self._overrides_by_offset = {}
 
     def translated_percent(self):
-        total_lines = 0
-        translated_lines = 0
-        for line in self._line_by_hash.values():
-            total_lines += 1
-            if line.en_text:
-                translated_lines += 1
-
-        return float(translated_lines) * 100.0 / float(total_lines)
+        return self._translated_count * 100.0 / len(self._line_by_hash)
 
     def get_charswap_map(self):
         return self._charswap_map
@@ -110,8 +142,8 @@ class TranslationDb:
     def set_charswap_map(self, swap_map):
         self._charswap_map = swap_map
 
-    def as_json(self):
-        return json.dumps({
+    def _as_dict(self):
+        return {
             'scene_map': {
                 k: [e.as_json() for e in v]
                 for k, v in self._scene_map.items()
@@ -123,7 +155,21 @@ class TranslationDb:
                 k: v.as_json() for k, v in self._overrides_by_offset.items()
             },
             'charswap_map': self._charswap_map
-        }, sort_keys=True, indent=2)
+        }
+
+    def as_json(self):
+        return json.dumps(self._as_dict(), sort_keys=True, indent=2)
+
+    @staticmethod
+    def dump_json_dict(db_dict, fp):
+        # Stream a snapshot from _as_dict directly into an open
+        # text-mode file, avoiding the full in-memory JSON string plus
+        # a second UTF-8 encoded copy. Same serialization options as
+        # as_json, so both save paths produce byte-identical output.
+        json.dump(db_dict, fp, sort_keys=True, indent=2)
+
+    def dump_json(self, fp):
+        self.dump_json_dict(self._as_dict(), fp)
 
     @classmethod
     def from_json(cls, jsonb):
@@ -447,13 +493,15 @@ class TranslationDb:
 
     @classmethod
     def from_file(cls, path):
-        with open(path, 'rb') as input_file:
-            raw_db = input_file.read()
-        return cls.from_json(json.loads(raw_db))
+        # Let the parser stream from a large-buffered text handle
+        # instead of slurping the file into an intermediate bytes object
+        with open(path, 'r', encoding='utf-8',
+                  buffering=1 << 20) as input_file:
+            return cls.from_json(json.load(input_file))
 
     def to_file(self, path):
-        with open(path, 'wb+') as output:
-            output.write(self.as_json().encode('utf-8'))
+        with open(path, 'w', encoding='utf-8', newline='') as output:
+            self.dump_json(output)
 
     def import_update_file(self, filename):
         # Parse diff
@@ -1,41 +1,94 @@
-import webbrowser
+import threading
 import tkinter as tk
+from tkinter import font as tkfont
+from tkinter import ttk
+
+# Shared font for the About widgets, created on first use so every
+# widget references one Tk font resource instead of re-parsing a
+# per-widget font string
+_FONT = None
 
 
 class InformationWindow:
 
+    # Cached window instance. The About dialog is rebuilt lazily on first
+    # open and then just re-shown, so repeat opens skip the Tk widget
+    # construction and layout pass entirely.
+    _instance = None
+
     def __init__(self, root):
         self._root = root
 
         self._root.title("deepLuna — About")
-        self._root.geometry("400x150")
         self._root.resizable(height=False, width=False)
 
+        # The window size is fixed, so the centering geometry can be
+        # computed up front from the screen dimensions alone without
+        # forcing a synchronous layout pass
+        width, height = 400, 150
+        screen_w = self._root.winfo_screenwidth()
+        screen_h = self._root.winfo_screenheight()
+        self._root.wm_geometry("%dx%d+%d+%d" % (
+            width, height,
+            (screen_w - width) // 2,
+            (screen_h - height) // 2
+        ))
+
+        # Register the shared font once; ttk buttons take their font
+        # from a style rather than a widget option
+        global _FONT
+        if _FONT is None:
+            _FONT = tkfont.Font(family='TkDefaultFont', size=11)
+            ttk.Style().configure('About.TButton', font=_FONT)
+
         # Add about text
-        tk.Label(
+        ttk.Label(
             self._root,
             text=(
                 "deepLuna v3.1.2 — 18/10/2021\n"
                 "Developed by Hakanaou and R.Schlaikjer\n"
             ),
-            font='TkDefaultFont 11',
+            font=_FONT,
             justify=tk.CENTER,
-            borderwidth=10
+            padding=10
         ).pack()
 
-        self.explanations = tk.Button(
+        self.explanations = ttk.Button(
             self._root,
             text="deepLuna GitHub",
-            font='TkDefaultFont 11',
+            style='About.TButton',
             command=self.btn_open_github
         )
         self.explanations.pack()
 
-        self._root.update_idletasks()
-        x = (self._root.winfo_screenwidth() - self._root.winfo_reqwidth()) / 2
-        y = (self._root.winfo_screenheight() - self._root.winfo_reqheight()) / 2
-        self._root.wm_geometry("+%d+%d" % (x, y))
+        # Hide instead of destroying on close so the widget tree survives
+        # for the next open
+        self._root.protocol("WM_DELETE_WINDOW", self._root.withdraw)
+
+    @classmethod
+    def show(cls, parent):
+        # Only build the widget tree on the first open; subsequent opens
+        # just re-map the cached window
+        if cls._instance is None:
+            cls._instance = cls(tk.Toplevel(parent))
+        else:
+            cls._instance._root.deiconify()
+        cls._instance._root.lift()
+        cls._instance._root.focus_set()
+        return cls._instance
 
     @staticmethod
     def btn_open_github():
-        webbrowser.open_new("https://github.com/Hakanaou/deepLuna")
+        # Imported lazily: webbrowser probes the system for browser
+        # handlers on import, which is wasted work at app startup if
+        # the About dialog is never opened
+        import webbrowser
+
+        # Launching the OS browser handler can block for hundreds of ms
+        # (xdg-open / LaunchServices), so run it off the Tk main thread.
+        # The worker makes no Tk calls, so this is thread-safe.
+        threading.Thread(
+            target=webbrowser.open_new,
+            args=("https://github.com/Hakanaou/deepLuna",),
+            daemon=True
+        ).start()
@@ -121,9 +121,7 @@ class StartWindow:
 
     def btn_open_about(self):
         # Create / display the info window
-        info_window_root = tk.Toplevel(self._root)
-        info_window_root.grab_set()
-        InformationWindow(info_window_root)
+        InformationWindow.show(self._root)
 
     def btn_extract_database(self):
         # If the DB is already extracted, prompt how to proceed
@@ -1,9 +1,14 @@
 import contextlib
+import functools
+import logging
 import os
+import re
 import shutil
+import threading
 import time
 
-from functools import cmp_to_key
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 import platform
 
@@ -18,87 +23,35 @@ from luna.constants import Constants
 from luna.readable_exporter import ReadableExporter
 from luna.translation_db import TranslationDb
 
-class VerticalScrolledFrame(tk.Frame):
-    """
-    Sorce: https://gist.github.com/JackTheEngineer/81df334f3dcff09fd19e4169dd560c59
-    
-    A pure Tkinter scrollable frame that actually works!
-    * Use the 'interior' attribute to place widgets inside the scrollable frame
-    * Construct and pack/place/grid normally
-    * This frame only allows vertical scrolling
-    * This comes from a different naming of the the scrollwheel 'button', on different systems.
-    """
-    def __init__(self, parent, *args, **kw):
-
-        super().__init__(parent, *args, **kw)
-
-        # create a canvas object and a vertical scrollbar for scrolling it
-        self.vscrollbar = tk.Scrollbar(self, orient=tk.VERTICAL)
-        self.vscrollbar.pack(fill=tk.Y, side=tk.RIGHT, expand=tk.FALSE)
-        self.canvas = tk.Canvas(self, bd=0, highlightthickness=0, yscrollcommand=self.vscrollbar.set)
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=tk.TRUE)
-        self.vscrollbar.config(command=self.canvas.yview)
-
-        # reset the view
-        self.canvas.xview_moveto(0)
-        self.canvas.yview_moveto(0)
-
-        # create a frame inside the canvas which will be scrolled with it
-        self.interior = tk.Frame(self.canvas)
-        self.interior_id = self.canvas.create_window(0, 0, window=self.interior,
-                                           anchor=tk.NW)
-
-        self.interior.grid_columnconfigure(0, weight=1)
-
-        self.interior.bind('<Configure>', self._configure_interior)
-        self.canvas.bind('<Configure>', self._configure_canvas)
-        self.canvas.bind('<Enter>', self._bind_to_mousewheel)
-        self.canvas.bind('<Leave>', self._unbind_from_mousewheel)
-
-        # track changes to the canvas and frame width and sync them,
-        # also updating the scrollbar
-
-    def _configure_interior(self, event):
-        # update the scrollbars to match the size of the inner frame
-        size = (self.interior.winfo_reqwidth(), self.interior.winfo_reqheight())
-        self.canvas.config(scrollregion="0 0 %s %s" % size)
-
-        if self.interior.winfo_reqwidth() != self.winfo_width():
-            # update the canvas's width to fit the inner frame
-            self.canvas.config(width=self.interior.winfo_reqwidth())
-
-    def _configure_canvas(self, event):
-        if self.interior.winfo_reqwidth() != self.winfo_width():
-            # update the inner frame's width to fill the canvas
-            self.canvas.itemconfigure(self.interior_id, width=self.winfo_width())
-
-    def onMouseWheel(self, event):
-        # cross platform scroll wheel event
-        if platform.system() == 'Windows':
-            self.canvas.yview_scroll(int(-1* (event.delta/120)), "units")
-        elif platform.system() == 'Darwin':
-            self.canvas.yview_scroll(int(-1 * event.delta), "units")
-        else:
-            if event.num == 4:
-                self.canvas.yview_scroll( -1, "units" )
-            elif event.num == 5:
-                self.canvas.yview_scroll( 1, "units" )
+# Resolved once at import; the scroll-wheel paths fire at up to
+# ~120 events/sec and shouldn't re-query it per event
+_PLATFORM = platform.system()
 
-    def _bind_to_mousewheel(self, event):
-        # bind wheel events when the cursor enters the control
-        if platform.system() == 'Linux':
-            self.canvas.bind_all("<Button-4>", self.onMouseWheel)
-            self.canvas.bind_all("<Button-5>", self.onMouseWheel)
-        else:
-            self.canvas.bind_all("<MouseWheel>", self.onMouseWheel)
+_log = logging.getLogger("deepluna.ui")
+
+# One "left,right" charswap pair per line, surrounding whitespace ignored
+_SWAP_RE = re.compile(r'^\s*([^,\n]+?)\s*,\s*([^,\n]+?)\s*$', re.MULTILINE)
+
+# Runs of ASCII digits vs everything else, for natural-sort tokenizing
+# of scene names
+_SCENE_TOK_RE = re.compile(r'[0-9]+|[^0-9]+')
+
+
+def _iter_txt_files(root):
+    # os.scandir-based walk: DirEntry caches the file type from the
+    # directory read itself, avoiding an extra stat() per entry
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".txt"):
+                        yield entry.path
+        except OSError:
+            continue
 
-    def _unbind_from_mousewheel(self, event):
-        # unbind wheel events when the cursorl leaves the control
-        if platform.system() == 'Linux':
-            self.canvas.unbind_all("<Button-4>")
-            self.canvas.unbind_all("<Button-5>")
-        else:
-            self.canvas.unbind_all("<MouseWheel>")
 
 class TranslationWindow:
 
@@ -108,22 +61,70 @@ class TranslationWindow:
     TKSTATE_CTRL = 0x0004
     TKSTATE_L_ALT = 0x0008
 
+    # Every combination of line-modifier markers, prejoined; indexed by
+    # ruby | glued << 1 | choice << 2 | override << 3 so the listbox
+    # row loop skips the per-line list build and join
+    _MODIFIER_STRS = tuple(
+        ' '.join(
+            marker
+            for marker, bit in (('*', 1), ('+', 2), ('?', 4), ('offset', 8))
+            if bits & bit
+        )
+        for bits in range(16)
+    )
+
     def __init__(self, root):
         # Cache TK root
         self._root = root
 
+        # Screen dimensions, captured once so dialogs can be centered
+        # without forcing a synchronous layout pass
+        self._screen_w = self._root.winfo_screenwidth()
+        self._screen_h = self._root.winfo_screenheight()
+
         # Reference for warning dialog handles
         self._warning = None
         self._conflict_dialog = None
         self._charswap_map_editor = None
 
-        # Currently loaded scene / string
+        # Shared message dialog, built lazily and reused across
+        # notifications instead of constructing a Toplevel per message
+        self._info_dialog = None
+        self._info_label = None
+
+        # Currently loaded scene / string. The line list is cached
+        # alongside the scene name so per-click handlers don't refetch
+        # it from the DB.
         self._loaded_scene = None
+        self._loaded_scene_lines = None
         self._loaded_offset = None
 
-        # Try and load the translation DB from file
-        self._translation_db = TranslationDb.from_file(
-            Constants.DATABASE_PATH)
+        # DB saves run on a worker thread; the lock serializes writes
+        # and the error slot carries a worker failure back to the Tk
+        # thread (e.g. so save_and_quit doesn't exit on a failed save)
+        self._save_lock = threading.Lock()
+        self._save_thread = None
+        self._save_error = None
+
+        # Bulk exports are likewise tracked so re-clicks are ignored
+        # while one is running and quitting waits for the files
+        self._export_thread = None
+
+        # The translation DB is parsed on a worker thread so the window
+        # maps immediately; _on_db_loaded fills these in once the parse
+        # finishes. Until then the guard sets are empty and DB-touching
+        # handlers no-op.
+        self._translation_db = None
+        self._tl_line_cached = None
+
+        # Cached per-scene translation statistics, computed lazily and
+        # dropped whenever translations change. (The global count lives
+        # in the DB itself, maintained incrementally.)
+        self._scene_translated_counts = {}
+        self._translated_hashes = set()
+        self._scene_names_set = set()
+        self._hash_line_count = Counter()
+        self._sha_index = None
 
         # Configure UI
         self._root.resizable(height=False, width=False)
@@ -151,53 +152,137 @@ class TranslationWindow:
         # Hook close function to prompt save
         self._root.protocol("WM_DELETE_WINDOW", self.on_close)
 
+        # Kick off the DB parse once the window has had a chance to map.
+        # The update-dir scan and stats init run in _on_db_loaded.
+        self._name_day.set('Loading translation DB... ')
+        self._root.after(10, self._start_db_load)
+
+        self._root.update_idletasks()
+        x = (self._root.winfo_screenwidth() - self._root.winfo_reqwidth()) / 2
+        y = (self._root.winfo_screenheight() - self._root.winfo_reqheight()) / 2
+        self._root.wm_geometry("+%d+%d" % (x, y))
+
+    def _start_db_load(self):
+        threading.Thread(target=self._load_db_worker, daemon=True).start()
+
+    def _load_db_worker(self):
+        # Runs off the Tk thread: parse only, no widget access. Results
+        # (or errors) are posted back to the main loop via after().
+        try:
+            db = TranslationDb.from_file(Constants.DATABASE_PATH)
+        except Exception as e:
+            self._root.after(0, self._on_db_load_failed, e)
+            return
+        self._root.after(0, self._on_db_loaded, db)
+
+    def _on_db_loaded(self, db):
+        self._translation_db = db
+
+        # Memoized view of tl_line_with_hash for the UI hot paths.
+        # Cleared whenever translations are written back to the DB.
+        self._tl_line_cached = functools.lru_cache(maxsize=4096)(
+            db.tl_line_with_hash)
+
+        # Set of jp hashes that currently have a translation, so
+        # per-line "is this translated" tests are a single set probe
+        self._translated_hashes = {
+            jp_hash
+            for jp_hash, tl in db._line_by_hash.items()
+            if tl.en_text
+        }
+
+        # Scene membership guard set; the scene list never changes while
+        # the editor is open, so build it once. scene_names() sorts a
+        # fresh list per call, so call it once here and share the result.
+        scene_names = db.scene_names()
+        self._scene_names_set = set(scene_names)
+
+        # How many script commands share each jp hash. The scene map is
+        # immutable while the editor is open, so count once up front
+        # instead of rescanning every scene on each line save.
+        self._hash_line_count = Counter(
+            line.jp_hash
+            for scene in scene_names
+            for line in db.lines_for_scene(scene)
+        )
+
+        # Fill in the scene selector
+        self._populate_scene_tree()
+
         # Scan update dir for any new files
         self.import_legacy_updates()
         self.import_updates()
 
         # Init total translated percent field
+        self._name_day.set('No day loaded ')
         self.update_global_tl_percent()
 
-        self._root.update_idletasks()
-        x = (self._root.winfo_screenwidth() - self._root.winfo_reqwidth()) / 2
-        y = (self._root.winfo_screenheight() - self._root.winfo_reqheight()) / 2
-        self._root.wm_geometry("+%d+%d" % (x, y))
+    def _on_db_load_failed(self, error):
+        self._name_day.set('Failed to load DB ')
+        self._show_info_dialog(
+            "deepLuna",
+            f"Failed to load translation DB:\n{error}")
 
     def update_global_tl_percent(self):
+        # O(1): the DB keeps a running translated-line count
         percent_translated = self._translation_db.translated_percent()
         self.percent_translated_global.delete("1.0", tk.END)
         self.percent_translated_global.insert(
             "1.0", "%.1f%%" % percent_translated)
 
+    def invalidate_tl_stat_caches(self):
+        # Called after bulk DB writes where incremental bookkeeping
+        # isn't worth the complexity
+        self._scene_translated_counts.clear()
+        self._translated_hashes = {
+            jp_hash
+            for jp_hash, tl in self._translation_db._line_by_hash.items()
+            if tl.en_text
+        }
+
     def update_selected_scene_tl_percent(self):
         # If there's no scene loaded, do nothing
         if not self._loaded_scene:
             return
 
         # How many lines are actually TLd
-        scene_lines = self._translation_db.lines_for_scene(self._loaded_scene)
-        idx = 0
-        translated_count = 0
-        for line in scene_lines:
-            tl_info = self._translation_db.tl_line_with_hash(line.jp_hash)
-            if tl_info.en_text:
-                translated_count += 1
-            idx += 1
+        scene_lines = self._loaded_scene_lines
+        translated_count = self._scene_translated_counts.get(
+            self._loaded_scene)
+        if translated_count is None:
+            translated_count = sum(
+                1 for line in scene_lines
+                if line.jp_hash in self._translated_hashes)
+            self._scene_translated_counts[self._loaded_scene] = \
+                translated_count
 
         # Update UI
         self.percent_translated_day.delete("1.0", tk.END)
         self.percent_translated_day.insert(
             "1.0",
-            str(round(translated_count*100/max(idx, 1), 1))+"%")
+            str(round(translated_count*100/max(len(scene_lines), 1), 1))+"%")
         self._name_day.set(self._loaded_scene + ": ")
 
     def on_close(self):
-        # Prompt to save the DB
+        # Prompt to save the DB; the prompt is built once and re-shown
+        # on later close attempts
+        if self._warning is None:
+            self._build_quit_warning()
+
+        x = self._root.winfo_x() + 40
+        y = self._root.winfo_y() + 40
+        self._warning.wm_geometry("+%d+%d" % (x, y))
+
+        self._warning.deiconify()
+        self._warning.lift()
+        self._warning.grab_set()
+
+    def _build_quit_warning(self):
         self._warning = tk.Toplevel(self._root)
         self._warning.title("deepLuna")
         self._warning.resizable(height=False, width=False)
         self._warning.attributes("-topmost", True)
-        self._warning.grab_set()
+        self._warning.protocol("WM_DELETE_WINDOW", self.close_warning)
 
         # Warning text
         warning_message = tk.Label(
@@ -227,30 +312,89 @@ class TranslationWindow:
         quit_button.grid(row=0, column=1, padx=5, pady=10)
         self.frame_quit_buttons.grid(row=1, column=0, pady=5)
 
-        self._root.update_idletasks()
-        self._warning.update()
-        x = self._root.winfo_x() + 40
-        y = self._root.winfo_y() + 40
-        self._warning.wm_geometry("+%d+%d" % (x, y))
-
     def save_and_quit(self):
-        # Save DB
-        with open(Constants.DATABASE_PATH, 'wb+') as output:
-            output.write(self._translation_db.as_json().encode('utf-8'))
+        # Nothing to save if the DB never finished loading
+        if self._translation_db is None:
+            self.quit_editor()
+            return
+
+        # Save DB, waiting for the write to actually hit disk
+        self.save_translation_table()
+        if self._save_thread:
+            self._save_thread.join()
+
+        # If the save failed, stay open; the worker already queued an
+        # error dialog explaining what happened
+        if self._save_error is not None:
+            return
 
         # Exit
         self.quit_editor()
 
     def close_warning(self):
+        # Hide rather than destroy so the dialog can be re-shown
         if self._warning:
             self._warning.grab_release()
-            self._warning.destroy()
-            self._warning = None
+            self._warning.withdraw()
 
     def quit_editor(self):
         self.close_warning()
+
+        # Let an in-flight export finish writing its files; the worker
+        # is a daemon thread and would otherwise die mid-write
+        if self._export_thread and self._export_thread.is_alive():
+            self._export_thread.join()
+
         self._root.destroy()
 
+    def _show_info_dialog(self, title, message):
+        # Build the dialog once; later notifications just retitle,
+        # swap the message text and re-show it
+        if self._info_dialog is None:
+            self._info_dialog = tk.Toplevel(self._root)
+            self._info_dialog.resizable(height=False, width=False)
+            self._info_dialog.attributes("-topmost", True)
+            self._info_dialog.protocol(
+                "WM_DELETE_WINDOW", self._dismiss_info_dialog)
+
+            self._info_label = tk.Label(
+                self._info_dialog,
+                font='TkDefaultFont 13',
+                justify=tk.LEFT
+            )
+            self._info_label.grid(row=0, column=0, padx=5, pady=5)
+
+            info_button = tk.Button(
+                self._info_dialog,
+                text="OK",
+                font='TkDefaultFont 13',
+                command=self._dismiss_info_dialog
+            )
+            info_button.grid(row=1, column=0, pady=10)
+
+        self._info_dialog.title(title)
+        self._info_label.config(text=message)
+
+        x = self._root.winfo_x() + 40
+        y = self._root.winfo_y() + 40
+        self._info_dialog.wm_geometry("+%d+%d" % (x, y))
+
+        self._info_dialog.deiconify()
+        self._info_dialog.lift()
+        self._info_dialog.grab_set()
+
+    def _dismiss_info_dialog(self):
+        if self._info_dialog:
+            self._info_dialog.grab_release()
+            self._info_dialog.withdraw()
+
+    def _center_dialog(self, dialog, width, height):
+        # Center from the cached screen size and the dialog's nominal
+        # size instead of update()-ing just to query winfo_req*
+        dialog.wm_geometry("+%d+%d" % (
+            (self._screen_w - width) // 2,
+            (self._screen_h - height) // 2))
+
     def init_tl_line_view(self):
         self.text_frame = tk.Frame(self.frame_editing, borderwidth=20)
 
@@ -417,10 +561,33 @@ class TranslationWindow:
         self.frame_editing.grid(row=1, column=0)
 
     def edit_charswap_map(self):
+        if self._translation_db is None:
+            return
+
+        # Build the editor once; later opens just refresh the text
+        # area and re-show the cached window
+        if self._charswap_map_editor is None:
+            self._build_charswap_editor()
+
+        # Initialize text area with existing map
+        existing_map = self._translation_db.get_charswap_map()
+        existing_map_text = "\n".join(
+            f"{k},{v}"
+            for k, v in existing_map.items()
+        )
+        self.swap_text_zone.delete("1.0", tk.END)
+        self.swap_text_zone.insert("1.0", existing_map_text)
+
+        self._charswap_map_editor.deiconify()
+        self._charswap_map_editor.lift()
+        self._charswap_map_editor.grab_set()
+
+    def _build_charswap_editor(self):
         self._charswap_map_editor = tk.Toplevel(self._root)
         self._charswap_map_editor.resizable(height=False, width=False)
         self._charswap_map_editor.title("Edit swap table")
-        self._charswap_map_editor.grab_set()
+        self._charswap_map_editor.protocol(
+            "WM_DELETE_WINDOW", self.close_charswap_editor)
 
         tk.Label(
             self._charswap_map_editor,
@@ -439,15 +606,6 @@ class TranslationWindow:
         )
         self.swap_text_zone.grid(row=1, column=0)
 
-        # Initialize text area with existing map
-        existing_map = self._translation_db.get_charswap_map()
-        existing_map_text = "\n".join([
-            f"{k},{v}"
-            for k, v in existing_map.items()
-        ])
-        self.swap_text_zone.delete("1.0", tk.END)
-        self.swap_text_zone.insert("1.0", existing_map_text)
-
         swap_frame_buttons = tk.Frame(
             self._charswap_map_editor, borderwidth=10)
 
@@ -468,28 +626,24 @@ class TranslationWindow:
         swap_warning_button.grid(row=0, column=1, pady=10)
         swap_frame_buttons.grid(row=2, column=0)
 
-        self._charswap_map_editor.update()
-        x = (self._charswap_map_editor.winfo_screenwidth() - self._charswap_map_editor.winfo_reqwidth()) / 2
-        y = (self._charswap_map_editor.winfo_screenheight() - self._charswap_map_editor.winfo_reqheight()) / 2
-        self._charswap_map_editor.wm_geometry("+%d+%d" % (x, y))
+        self._center_dialog(self._charswap_map_editor, 340, 720)
 
     def save_charswap_config(self):
         # Retrieve the new settings text
         swap_conf_text = self.swap_text_zone.get("1.0", tk.END)
 
-        # Split out the entries
-        swap_map = {}
-        for line in swap_conf_text.split("\n"):
-            # Ignore blanks
-            if not line:
-                continue
+        # Pull out all well-formed pairs in one compiled-regex pass
+        # instead of a split/strip loop per line
+        matched_pairs = _SWAP_RE.findall(swap_conf_text)
+        swap_map = dict(matched_pairs)
 
-            # Split on comma
-            split_line = line.split(",")
-            if len(split_line) != 2:
-                print(f"Invalid charswap entry '{line}', ignoring")
-                continue
-            swap_map[split_line[0].strip()] = split_line[1].strip()
+        # Report malformed lines once, not one print per line
+        candidate_lines = sum(
+            1 for line in swap_conf_text.splitlines() if line.strip())
+        if candidate_lines != len(matched_pairs):
+            _log.info(
+                "Ignored %d invalid charswap entries",
+                candidate_lines - len(matched_pairs))
 
         # Write the swap map to the TL DB
         self._translation_db.set_charswap_map(swap_map)
@@ -501,10 +655,10 @@ class TranslationWindow:
         self.close_charswap_editor()
 
     def close_charswap_editor(self):
+        # Hide rather than destroy so the cached editor can be re-shown
         if self._charswap_map_editor:
             self._charswap_map_editor.grab_release()
-            self._charswap_map_editor.destroy()
-            self._charswap_map_editor = None
+            self._charswap_map_editor.withdraw()
 
     def save_line(self):
         # Is a valid string loaded
@@ -512,44 +666,62 @@ class TranslationWindow:
             return
 
         # Check the active scene is valid
-        if self._loaded_scene not in self._translation_db.scene_names():
+        if self._loaded_scene not in self._scene_names_set:
             return
 
         # Get the line info for the selected offset
-        scene_lines = self._translation_db.lines_for_scene(self._loaded_scene)
+        scene_lines = self._loaded_scene_lines
         selected_line = scene_lines[self._loaded_offset]
         offset = selected_line.offset
         jp_hash = selected_line.jp_hash
-        exist_text = self._translation_db.tl_line_with_hash(jp_hash).en_text
-        exist_comment = self._translation_db.tl_line_with_hash(jp_hash).comment
-        count = self.find_sha_lines(jp_hash)[0]
+        tl_line = self._tl_line_cached(jp_hash)
+        exist_text = tl_line.en_text
+        exist_comment = tl_line.comment
+        count = self._hash_line_count[jp_hash]
 
         # Extract the new tl/comment
         new_tl = self.text_translated.get("1.0", tk.END).strip("\n")
         new_comment = self.text_comment.get("1.0", tk.END).strip("\n")
 
-        # Write them back to the translation DB
-        write_by_sha = self.var_write_sha.get()
-        if write_by_sha or not (exist_text and count > 1 and \
-                    ((new_tl != exist_text and exist_text != None) \
-                    or (new_comment != exist_comment and exist_comment != None))):
-            print("Write by sha")
+        # Write them back to the translation DB. Edits go by hash unless
+        # the line is already translated, is shared by multiple script
+        # commands, and the text actually changed — in which case the
+        # edit only applies to this offset. Normalize None to "" before
+        # comparing: the text widgets always yield strings, so an
+        # untouched empty field must not count as a change.
+        changed = new_tl != (exist_text or "") \
+            or new_comment != (exist_comment or "")
+        write_by_sha = self.var_write_sha.get() \
+            or not (exist_text and count > 1 and changed)
+        if write_by_sha:
+            _log.debug("Write by sha")
             self._translation_db.set_translation_and_comment_for_hash(
                 jp_hash,
                 new_tl,
                 new_comment
             )
-            if offset in self._translation_db._overrides_by_offset:
-                del self._translation_db._overrides_by_offset[offset]
+            self._translation_db._overrides_by_offset.pop(offset, None)
+
+            # Keep the translated-hash set in step with the edit
+            if new_tl:
+                self._translated_hashes.add(jp_hash)
+            else:
+                self._translated_hashes.discard(jp_hash)
 
         else:
-            print("Override by offset")
+            _log.debug("Override by offset")
             self._translation_db.override_translation_and_comment_for_offset(
                 offset,
                 new_tl,
                 new_comment
             )
 
+        # The DB changed under the memoized lookups. A hash edit can
+        # touch any scene sharing the hash, so just let the per-scene
+        # counts recount lazily.
+        self._tl_line_cached.cache_clear()
+        self._scene_translated_counts.clear()
+
         # Mark the line as green
         self.listbox_offsets.itemconfig(self._loaded_offset, bg='#BCECC8')
 
@@ -558,11 +730,40 @@ class TranslationWindow:
         self.update_selected_scene_tl_percent()
 
     def save_translation_table(self):
-        # Write out the translation DB to file
-        with open(Constants.DATABASE_PATH, 'wb+') as output:
-            output.write(self._translation_db.as_json().encode('utf-8'))
+        if self._translation_db is None:
+            return
+
+        # Snapshot the DB on the Tk thread so the worker never walks
+        # the live dicts while edit handlers keep mutating them; only
+        # the serialization and disk write run off-thread
+        snapshot = self._translation_db._as_dict()
+        self._save_error = None
+        self._save_thread = threading.Thread(
+            target=self._save_db_worker, args=(snapshot,), daemon=True)
+        self._save_thread.start()
+
+    def _save_db_worker(self, snapshot):
+        try:
+            with self._save_lock:
+                # Stream the snapshot to a temp file, then atomically
+                # swap it in so a crash mid-write can't corrupt the DB
+                tmp_path = Constants.DATABASE_PATH + '.tmp'
+                with open(tmp_path, 'w',
+                          encoding='utf-8', newline='') as output:
+                    TranslationDb.dump_json_dict(snapshot, output)
+                    output.flush()
+                    os.fsync(output.fileno())
+                os.replace(tmp_path, Constants.DATABASE_PATH)
+        except Exception as e:
+            self._save_error = e
+            self._root.after(
+                0, self._show_info_dialog, "Save Failed",
+                f"Failed to save translation DB:\n{e}")
 
     def insert_translation(self):
+        if self._translation_db is None:
+            return
+
         # Export the script as an MZP
         mzp_data = self._translation_db.generate_script_text_mrg(
             perform_charswap=self.var_swapText.get())
@@ -573,122 +774,72 @@ class TranslationWindow:
         with open(output_filename, 'wb+') as f:
             f.write(mzp_data)
 
-        print(f"Exported translation to {output_filename}")
+        _log.info("Exported translation to %s", output_filename)
 
         # Dialog
-        self._warning = tk.Toplevel(self._root)
-        self._warning.title("Injection Complete")
-        self._warning.resizable(height=False, width=False)
-        self._warning.attributes("-topmost", True)
-        self._warning.grab_set()
-
-        # Set message
-        warning_message = tk.Label(
-            self._warning,
-            text=f"Script injected to {output_filename}",
-            font='TkDefaultFont 13',
-            justify=tk.LEFT
-        )
-        warning_message.grid(row=0, column=0, padx=5, pady=5)
-
-        # Button choices
-        warning_button = tk.Button(
-            self._warning,
-            text="OK",
-            font='TkDefaultFont 13',
-            command=self.close_warning
-        )
-        warning_button.grid(row=1, column=0, pady=10)
-
-        self._root.update_idletasks()
-        self._warning.update()
-        x = self._root.winfo_x() + 40
-        y = self._root.winfo_y() + 40
-        self._warning.wm_geometry("+%d+%d" % (x, y))
+        self._show_info_dialog(
+            "Injection Complete",
+            f"Script injected to {output_filename}")
 
     def export_page(self):
+        if self._translation_db is None or self._loaded_scene is None:
+            return
+
         self._translation_db.export_scene(
             self._loaded_scene, Constants.EXPORT_DIRECTORY)
 
         # Dialog
-        self._warning = tk.Toplevel(self._root)
-        self._warning.title("Export Complete")
-        self._warning.resizable(height=False, width=False)
-        self._warning.attributes("-topmost", True)
-        self._warning.grab_set()
-
-        # Set message
-        warning_message = tk.Label(
-            self._warning,
-            text=f"Exported scene {self._loaded_scene} "
-                 f"to {Constants.EXPORT_DIRECTORY}",
-            font='TkDefaultFont 13',
-            justify=tk.LEFT
-        )
-        warning_message.grid(row=0, column=0, padx=5, pady=5)
-
-        # Button choices
-        warning_button = tk.Button(
-            self._warning,
-            text="OK",
-            font='TkDefaultFont 13',
-            command=self.close_warning
-        )
-        warning_button.grid(row=1, column=0, pady=10)
-
-        self._root.update_idletasks()
-        self._warning.update()
-        x = self._root.winfo_x() + 40
-        y = self._root.winfo_y() + 40
-        self._warning.wm_geometry("+%d+%d" % (x, y))
+        self._show_info_dialog(
+            "Export Complete",
+            f"Exported scene {self._loaded_scene} "
+            f"to {Constants.EXPORT_DIRECTORY}")
 
     def export_all_pages(self):
-        for scene in self._translation_db.scene_names():
-            self._translation_db.export_scene(
-                scene, Constants.EXPORT_DIRECTORY)
+        if self._translation_db is None:
+            return
 
-        # Dialog
-        self._warning = tk.Toplevel(self._root)
-        self._warning.title("Export Complete")
-        self._warning.resizable(height=False, width=False)
-        self._warning.attributes("-topmost", True)
-        self._warning.grab_set()
+        # One export at a time: a second worker would truncate and
+        # rewrite the same files the first is still writing
+        if self._export_thread and self._export_thread.is_alive():
+            return
 
-        # Set message
-        warning_message = tk.Label(
-            self._warning,
-            text=f"Exported all scenes to {Constants.EXPORT_DIRECTORY}",
-            font='TkDefaultFont 13',
-            justify=tk.LEFT
-        )
-        warning_message.grid(row=0, column=0, padx=5, pady=5)
+        # Run the export off the Tk thread so the UI stays responsive
+        self._export_thread = threading.Thread(
+            target=self._export_all_worker, daemon=True)
+        self._export_thread.start()
 
-        # Button choices
-        warning_button = tk.Button(
-            self._warning,
-            text="OK",
-            font='TkDefaultFont 13',
-            command=self.close_warning
-        )
-        warning_button.grid(row=1, column=0, pady=10)
+    def _export_all_worker(self):
+        try:
+            # Scene exports are mostly file I/O, so overlap them
+            with ThreadPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 4)) as executor:
+                futures = [
+                    executor.submit(
+                        self._translation_db.export_scene,
+                        scene, Constants.EXPORT_DIRECTORY)
+                    for scene in self._translation_db.scene_names()
+                ]
+                for future in futures:
+                    future.result()
+        except Exception as e:
+            self._root.after(
+                0, self._show_info_dialog, "Export Failed",
+                f"Failed to export scenes:\n{e}")
+            return
 
-        self._root.update_idletasks()
-        self._warning.update()
-        x = self._root.winfo_x() + 40
-        y = self._root.winfo_y() + 40
-        self._warning.wm_geometry("+%d+%d" % (x, y))
-        self._warning.grab_set()
+        # The dialog must be shown from the Tk thread
+        self._root.after(
+            0,
+            self._show_info_dialog,
+            "Export Complete",
+            f"Exported all scenes to {Constants.EXPORT_DIRECTORY}")
 
     def import_updates(self):
-        # Any goodies for us in the update folder?
-        candidate_files = []
-        for basedir, dirs, files in os.walk(Constants.IMPORT_DIRECTORY):
-            for filename in files:
-                # Ignore non-text files
-                if not filename.endswith(".txt"):
-                    continue
+        if self._translation_db is None:
+            return
 
-                candidate_files.append(os.path.join(basedir, filename))
+        # Any goodies for us in the update folder?
+        candidate_files = list(_iter_txt_files(Constants.IMPORT_DIRECTORY))
 
         # Generate a diff
         import_diff = self._translation_db.parse_update_file_list(
@@ -696,15 +847,13 @@ class TranslationWindow:
 
         # Apply non-conflict data immediately
         self._translation_db.apply_diff(import_diff)
+        self._tl_line_cached.cache_clear()
+        self.invalidate_tl_stat_caches()
 
-        # Clear out the input files
-        for basedir, dirs, files in os.walk(Constants.IMPORT_DIRECTORY):
-            for dirname in dirs:
-                shutil.rmtree(os.path.join(basedir, dirname))
-                pass
-            for filename in files:
-                os.unlink(os.path.join(basedir, filename))
-                pass
+        # Clear out the input files by recreating the import dir in one
+        # shot rather than re-walking it to unlink file by file
+        shutil.rmtree(Constants.IMPORT_DIRECTORY, ignore_errors=True)
+        os.makedirs(Constants.IMPORT_DIRECTORY, exist_ok=True)
 
         # If there are no conflicts, we are done
         if not import_diff.any_conflicts():
@@ -712,6 +861,11 @@ class TranslationWindow:
 
         self.show_conflict_resolution(import_diff)
 
+    # Pixel height of the virtualized conflict viewport. The per-row
+    # pitch is measured from a real slot when the dialog opens, since
+    # listbox row height is font- and platform-dependent.
+    CONFLICT_VIEW_HEIGHT = 540
+
     def show_conflict_resolution(self, diff):
 
         # Cache the active conflict set
@@ -722,7 +876,33 @@ class TranslationWindow:
             if not entry_group.is_unique()
         }
 
-        print(f"Conflict count: {len(self._active_conflicts)}")
+        _log.info("Conflict count: %d", len(self._active_conflicts))
+
+        # Render the listbox rows once up front. The virtualized list
+        # re-populates recycled listboxes on every scroll, so formatting
+        # in the render path would redo the basename/f-string work each
+        # time a row comes back into view.
+        for entry_group in self._active_conflicts.values():
+            for entry in entry_group.entries:
+                entry._display = (
+                    f"{os.path.basename(entry.filename)}:L{entry.line}: "
+                    f"offset: {entry._offset}, {entry.en_text}"
+                )
+
+        # Size the recycled listboxes to the largest conflict group so
+        # no candidate translation is clipped out of reach
+        max_entries = max(
+            len(group.entries)
+            for group in self._active_conflicts.values())
+        self._conflict_listbox_height = max_entries
+
+        # Model for the virtualized conflict list. Selections are tracked
+        # here rather than in the listboxes, since the listbox widgets are
+        # recycled as the list scrolls. The sorted hash tuple is computed
+        # once and shared with commit_conflict_resolution.
+        self._ordered_conflict_hashes = tuple(
+            sorted(self._active_conflicts.keys()))
+        self._conflict_selections = {}
 
         # Prompt to save the DB
         self._conflict_dialog = tk.Toplevel(self._root)
@@ -740,58 +920,52 @@ class TranslationWindow:
         )
         warning_message.grid(row=0, column=0, pady=5)
 
-        # Conflict entries
-        self._conflict_listboxes = []
-        frame_listboxes = VerticalScrolledFrame(self._conflict_dialog, borderwidth=2)
-        ordered_hashes = sorted(self._active_conflicts.keys())
-        for jp_hash in ordered_hashes:
-            jp_text = self._translation_db.tl_line_with_hash(jp_hash).jp_text
-            entry_group = self._active_conflicts[jp_hash]
-            
-            conflict_text = tk.Text(frame_listboxes.interior,
-                height = 3,
-                wrap="word",
-                font='TkDefaultFont 13',
-                bg="#f0f0f0",
-                highlightbackground="#A8A8A8"
-            )
-            conflict_text.grid(row=len(self._conflict_listboxes)*2, column=0, sticky="we")
-            conflict_text.insert("1.0", f"{len(entry_group.entries)} "
-                f"lines of:\n{jp_hash}\n{jp_text.rstrip()}"
-             )
-            conflict_text.config(state=tk.DISABLED)
-
-            print(f"{len(entry_group.entries)} lines of:\n{jp_hash}\n{jp_text.rstrip()}")
-
-            # Create a listbox to select the correct tl
-            option_listbox = tk.Listbox(
-                frame_listboxes.interior,
-                height=len(entry_group.entries),
-                font='TkDefaultFont 13',
-                exportselection=True,
-                selectmode=tk.MULTIPLE 
-            )
-            option_listbox.grid(
-                row=len(self._conflict_listboxes)*2+1,
-                column=0,
-                pady=5,
-                sticky="nswe"
-            )
-
-            # Populate
-            idx = 0
-            for entry in entry_group.entries:
-                option_listbox.insert(
-                    idx,
-                    f"{os.path.basename(entry.filename)}:L{entry.line}: "
-                    f"offset: {entry._offset}, {entry.en_text}"
-                )
-                idx += 1
+        # Conflict entries are rendered into a fixed pool of recycled
+        # widget rows scrolled over a canvas, so the widget count is
+        # bounded by the viewport size instead of the conflict count
+        self._conflict_canvas = tk.Canvas(
+            self._conflict_dialog,
+            bd=0,
+            highlightthickness=0,
+            width=700,
+            height=self.CONFLICT_VIEW_HEIGHT
+        )
+        self._conflict_scrollbar = tk.Scrollbar(
+            self._conflict_dialog,
+            orient=tk.VERTICAL,
+            command=self._scroll_conflict_canvas
+        )
+        self._conflict_canvas.config(
+            yscrollcommand=self._conflict_scrollbar.set)
+
+        # Measure the real row pitch from one fully built slot instead
+        # of guessing pixel sizes: listbox row height depends on the
+        # font and platform, and an undersized pitch clips tall groups.
+        # The idletask flush lets the packer compute the probe's
+        # requested height.
+        probe = self._build_conflict_slot()
+        self._conflict_dialog.update_idletasks()
+        self._conflict_row_height = probe['frame'].winfo_reqheight() + 8
+
+        self._conflict_canvas.config(scrollregion=(
+            0, 0,
+            0, self._conflict_row_height * len(self._ordered_conflict_hashes)))
+
+        # Build the widget pool: just enough rows to cover the viewport
+        pool_size = min(
+            len(self._ordered_conflict_hashes),
+            self.CONFLICT_VIEW_HEIGHT // self._conflict_row_height + 2
+        )
+        self._conflict_slots = [probe] + [
+            self._build_conflict_slot() for _ in range(1, pool_size)
+        ]
 
-            # Cache a reference
-            self._conflict_listboxes.append(option_listbox)
-        frame_listboxes.grid_columnconfigure(0, weight=1)
-        frame_listboxes.grid(row=1, column=0, pady=5, sticky="nsew")
+        self._conflict_canvas.bind(
+            '<Configure>', self._on_conflict_canvas_configure)
+        self._conflict_canvas.bind('<Enter>', self._bind_conflict_wheel)
+        self._conflict_canvas.bind('<Leave>', self._unbind_conflict_wheel)
+        self._conflict_canvas.grid(row=1, column=0, pady=5, sticky="nsew")
+        self._conflict_scrollbar.grid(row=1, column=1, sticky="ns")
 
         # Buttons
         frame_quit_buttons = tk.Frame(self._conflict_dialog, borderwidth=2)
@@ -818,38 +992,190 @@ class TranslationWindow:
         self._conflict_dialog.grid_rowconfigure(1, weight=1)
         self._conflict_dialog.grid_rowconfigure(2, weight=0)
 
-        self._conflict_dialog.update()
-        x = (self._conflict_dialog.winfo_screenwidth() - self._conflict_dialog.winfo_reqwidth()) / 2
-        y = (self._conflict_dialog.winfo_screenheight() - self._conflict_dialog.winfo_reqheight()) / 2
-        self._conflict_dialog.wm_geometry("+%d+%d" % (x, y))
+        self._center_dialog(self._conflict_dialog, 720, 680)
+
+        # Initial render of the visible slice
+        self._render_conflict_rows()
+
+    def _build_conflict_slot(self):
+        # Create one recyclable conflict row: a readonly text block for
+        # the JP line info and a listbox for the candidate translations.
+        # Rows are positioned by _render_conflict_rows and keep their
+        # natural (unforced) height so nothing gets pack-squeezed.
+        frame = tk.Frame(self._conflict_canvas)
+        conflict_text = tk.Text(frame,
+            height=3,
+            wrap="word",
+            font='TkDefaultFont 13',
+            bg="#f0f0f0",
+            highlightbackground="#A8A8A8"
+        )
+        conflict_text.pack(fill=tk.X)
+        conflict_text.config(state=tk.DISABLED)
+
+        option_listbox = tk.Listbox(
+            frame,
+            height=self._conflict_listbox_height,
+            font='TkDefaultFont 13',
+            exportselection=False,
+            selectmode=tk.MULTIPLE
+        )
+        option_listbox.pack(fill=tk.BOTH, expand=True)
+
+        slot = {
+            'window': self._conflict_canvas.create_window(
+                0, 0,
+                window=frame,
+                anchor=tk.NW
+            ),
+            'frame': frame,
+            'text': conflict_text,
+            'listbox': option_listbox,
+            'hash': None,
+        }
+
+        # Persist selections into the model so they survive recycling
+        option_listbox.bind(
+            '<<ListboxSelect>>',
+            lambda _event, slot=slot: self._on_conflict_select(slot))
+        return slot
+
+    def _on_conflict_select(self, slot):
+        if slot['hash'] is not None:
+            self._conflict_selections[slot['hash']] = \
+                slot['listbox'].curselection()
+
+    def _scroll_conflict_canvas(self, *args):
+        self._conflict_canvas.yview(*args)
+        self._render_conflict_rows()
+
+    def _on_conflict_wheel(self, event):
+        # Cross platform scroll wheel event
+        if _PLATFORM == 'Windows':
+            self._conflict_canvas.yview_scroll(
+                int(-1 * (event.delta / 120)), "units")
+        elif _PLATFORM == 'Darwin':
+            self._conflict_canvas.yview_scroll(int(-1 * event.delta), "units")
+        else:
+            if event.num == 4:
+                self._conflict_canvas.yview_scroll(-1, "units")
+            elif event.num == 5:
+                self._conflict_canvas.yview_scroll(1, "units")
+        self._render_conflict_rows()
+
+    def _bind_conflict_wheel(self, _event):
+        if _PLATFORM == 'Linux':
+            self._conflict_canvas.bind_all(
+                "<Button-4>", self._on_conflict_wheel)
+            self._conflict_canvas.bind_all(
+                "<Button-5>", self._on_conflict_wheel)
+        else:
+            self._conflict_canvas.bind_all(
+                "<MouseWheel>", self._on_conflict_wheel)
+
+    def _unbind_conflict_wheel(self, _event):
+        if _PLATFORM == 'Linux':
+            self._conflict_canvas.unbind_all("<Button-4>")
+            self._conflict_canvas.unbind_all("<Button-5>")
+        else:
+            self._conflict_canvas.unbind_all("<MouseWheel>")
+
+    def _on_conflict_canvas_configure(self, event):
+        # Stretch the pooled rows to the new viewport width
+        for slot in self._conflict_slots:
+            self._conflict_canvas.itemconfigure(
+                slot['window'], width=event.width)
+        self._render_conflict_rows()
+
+    def _render_conflict_rows(self):
+        # Map each pooled widget row onto the conflict slice currently in
+        # view. Rows already showing the right conflict are left alone.
+        canvas = self._conflict_canvas
+        total = len(self._ordered_conflict_hashes)
+        first = int(canvas.yview()[0] * total)
+        for i, slot in enumerate(self._conflict_slots):
+            row = first + i
+            if row >= total:
+                canvas.itemconfigure(slot['window'], state=tk.HIDDEN)
+                slot['hash'] = None
+                continue
+
+            canvas.itemconfigure(slot['window'], state=tk.NORMAL)
+            canvas.coords(slot['window'], 0, row * self._conflict_row_height)
+
+            jp_hash = self._ordered_conflict_hashes[row]
+            if slot['hash'] == jp_hash:
+                continue
+            slot['hash'] = jp_hash
+
+            entry_group = self._active_conflicts[jp_hash]
+            jp_text = self._tl_line_cached(jp_hash).jp_text
+
+            conflict_text = slot['text']
+            conflict_text.config(state=tk.NORMAL)
+            conflict_text.delete("1.0", tk.END)
+            conflict_text.insert("1.0", f"{len(entry_group.entries)} "
+                f"lines of:\n{jp_hash}\n{jp_text.rstrip()}"
+            )
+            conflict_text.config(state=tk.DISABLED)
+
+            # Rows were formatted when the dialog opened; push them in
+            # one Tcl call instead of one interpreter round-trip per entry
+            items = [entry._display for entry in entry_group.entries]
+            option_listbox = slot['listbox']
+            option_listbox.delete(0, tk.END)
+            option_listbox.insert(tk.END, *items)
+
+            # Restore any selection previously made for this conflict
+            option_listbox.selection_clear(0, tk.END)
+            for selected in self._conflict_selections.get(jp_hash, ()):
+                option_listbox.selection_set(selected)
 
     def commit_conflict_resolution(self):
-        # Iterate each of the selectors, and if something is selected commit it
-        ordered_hashes = sorted(self._active_conflicts.keys())
-        for i in range(len(ordered_hashes)):
-            jp_hash = ordered_hashes[i]
+        # Iterate each conflict group, and if something is selected
+        # commit it. Selections live in the model dict, not in the
+        # (recycled) listbox widgets. Offset overrides are collected
+        # and applied in one bulk DB call at the end.
+        override_updates = {}
+        for jp_hash in self._ordered_conflict_hashes:
             entry_group = self._active_conflicts[jp_hash]
 
-            listbox = self._conflict_listboxes[i]
-            selected_indexes = listbox.curselection()
+            selected_indexes = self._conflict_selections.get(jp_hash)
             if not selected_indexes:
                 continue
 
-            for index in range(listbox.size()):
+            # curselection() hands back a tuple; membership against it
+            # is a linear scan, so probe a set instead. The direction is
+            # deliberate: unselected rows are written by sha (the shared
+            # default), selected rows by offset, matching the dialog's
+            # "Select rows to write them by offset" prompt.
+            selected_indexes = set(selected_indexes)
+
+            for index in range(len(entry_group.entries)):
                 if index not in selected_indexes:
                     selected_tl = entry_group.entries[index]
-                    print(f"Commit line by {jp_hash}: {selected_tl.en_text}")
+                    _log.debug(
+                        "Commit line by %s: %s", jp_hash, selected_tl.en_text)
                     self._translation_db.set_translation_and_comment_for_hash(
                         jp_hash, selected_tl.en_text, selected_tl.comment
                     )
-                    if selected_tl._offset in self._translation_db._overrides_by_offset:
-                        del self._translation_db._overrides_by_offset[selected_tl._offset]
+                    self._translation_db._overrides_by_offset.pop(
+                        selected_tl._offset, None)
 
             for selected in selected_indexes:
                 selected_tl = entry_group.entries[selected]
-                print(f"Commit line by offset {selected_tl._offset}: {selected_tl.en_text}")
-                self._translation_db.override_translation_and_comment_for_offset(
-                    selected_tl._offset, selected_tl.en_text, selected_tl.comment)
+                _log.debug(
+                    "Commit line by offset %s: %s",
+                    selected_tl._offset, selected_tl.en_text)
+                override_updates[selected_tl._offset] = \
+                    (selected_tl.en_text, selected_tl.comment)
+
+        if override_updates:
+            self._translation_db.override_translations_bulk(
+                override_updates)
+
+        self._tl_line_cached.cache_clear()
+        self.invalidate_tl_stat_caches()
 
         # Close the dialog
         self.dismiss_conflict_resolution()
@@ -861,26 +1187,22 @@ class TranslationWindow:
             self._conflict_dialog = None
 
     def import_legacy_updates(self):
-        # Scan the legacy update folder for old-style files
-        for basedir, dirs, files in os.walk(Constants.LEGACY_IMPORT_DIRECTORY):
-            for filename in files:
-                # Ignore non-text files
-                if not filename.endswith(".txt"):
-                    continue
-
-                # Import the changes from the file
-                try:
-                    absolute_path = os.path.join(basedir, filename)
-                    self._translation_db.import_legacy_update_file(
-                        absolute_path)
-
-                    # If we successfully loaded it, delete it.
-                    os.unlink(absolute_path)
-                except AssertionError as e:
-                    print(
-                        f"Failed to apply updates from {filename}: "
-                        f"{e}"
-                    )
+        # Scan the legacy update folder for old-style files, using the
+        # same scandir walk as the regular import path
+        for path in _iter_txt_files(Constants.LEGACY_IMPORT_DIRECTORY):
+            # Import the changes from the file
+            try:
+                self._translation_db.import_legacy_update_file(path)
+
+                # If we successfully loaded it, delete it.
+                os.unlink(path)
+            except AssertionError as e:
+                _log.warning(
+                    "Failed to apply updates from %s: %s",
+                    os.path.basename(path), e)
+
+        self._tl_line_cached.cache_clear()
+        self.invalidate_tl_stat_caches()
 
     def init_line_selector(self):
         self.line_selector_frame = tk.Frame(self.frame_editing, borderwidth=20)
@@ -902,8 +1224,9 @@ class TranslationWindow:
             exportselection=False,
             selectmode=tk.BROWSE
         )
-        self.listbox_offsets.bind('<Button-1>', self.load_translation_line)
-        self.listbox_offsets.bind('<Return>', self.load_translation_line)
+        # <<ListboxSelect>> already fires for both mouse and keyboard
+        # selection changes; binding Button-1/Return as well just made
+        # the handler run two or three times per click
         self.listbox_offsets.bind('<<ListboxSelect>>', self.load_translation_line)
         self.listbox_offsets.grid(row = 1, column = 0, sticky = "nsew")
         self.scrollbar_offsets = tk.Scrollbar(self.line_selector_frame)
@@ -915,71 +1238,27 @@ class TranslationWindow:
         self.line_selector_frame.grid(row = 0, column = 1, sticky = "n")
 
     @staticmethod
-    def compare_scenes(in_a, in_b):
+    def decimal_extract(val):
+        # One pass of the compiled regex splits the name into digit /
+        # non-digit runs, replacing the old per-character state machine
+        return [
+            int(token) if '0' <= token[0] <= '9' else token
+            for token in _SCENE_TOK_RE.findall(val)
+        ]
+
+    @staticmethod
+    def scene_sort_key(val):
         """
-        Compare function for scene names that sorts integer fragments properly.
+        Sort key for scene names that orders integer fragments
+        numerically. Integer fragments sort before string fragments,
+        matching the type-name ordering of the comparator this replaced.
+        sorted() computes the key once per name instead of re-tokenizing
+        both operands on every comparison.
         """
-        def decimal_extract(val):
-            ret = []
-            is_chr = True
-            acc = ""
-            for c in val:
-                if '0' <= c and c <= '9':
-                    # If there was a character acc, append it
-                    if is_chr and acc:
-                        ret.append(acc)
-                        acc = ""
-
-                    # Now in non-char acc mode
-                    is_chr = False
-                    acc += c
-                else:
-                    # If there was a non-char acc, apend it
-                    if not is_chr and acc:
-                        ret.append(int(acc))
-                        acc = ""
-
-                    # Now in char mode
-                    is_chr = True
-                    acc += c
-
-            # Handle trailing acc value
-            if acc:
-                ret.append(acc if is_chr else int(acc))
-
-            return ret
-
-        scene_a = decimal_extract(in_a)
-        scene_b = decimal_extract(in_b)
-
-        i = 0
-        for i in range(max(len(scene_a), len(scene_b))):
-            # Longer is greater
-            if i >= len(scene_a):
-                return -1
-            if i >= len(scene_b):
-                return 1
-
-            # If the types match, direct compare
-            val_a = scene_a[i]
-            val_b = scene_b[i]
-            if type(val_a) is type(val_b):
-                if val_a < val_b:
-                    return -1
-                if val_a > val_b:
-                    return 1
-            else:
-                # If the types don't match, compare on the lex order of
-                # type names
-                type_a_name = str(type(val_a))
-                type_b_name = str(type(val_b))
-                if type_a_name < type_b_name:
-                    return -1
-                if type_a_name > type_b_name:
-                    return 1
-
-        # If we get all the way here, they are equal
-        return 0
+        return tuple(
+            (0, token) if isinstance(token, int) else (1, token)
+            for token in TranslationWindow.decimal_extract(val)
+        )
 
     def init_scene_selector_tree(self):
         self.frame_tree = tk.Frame(self.frame_editing, borderwidth=20)
@@ -994,14 +1273,34 @@ class TranslationWindow:
         self.scene_tree.config(yscrollcommand=self.scrollbar_scene_tree.set)
         self.scrollbar_scene_tree.config(command=self.scene_tree.yview)
 
-        # Add all of the scene names to the treeview
+        # Double-click scenes to load
+        # self.scene_tree.bind('<Double-Button-1>', self.load_scene)
+        self.scene_tree.bind('<<TreeviewSelect>>', self.load_scene)
+        self.scene_tree.grid(row=0, column=0, padx=5, pady=5, sticky='nsew')
+        self.scrollbar_scene_tree.grid(row=0, column=1, sticky="ns")
+        self.frame_tree.grid(row = 0, column = 0, sticky = "n")
+
+    def _populate_scene_tree(self):
+        # Unmap the tree while rows are bulk-inserted so Tk doesn't
+        # redraw it per row; re-grid once at the end for a single layout
+        self.scene_tree.grid_remove()
+
+        # Bucket every scene name in a single pass rather than one
+        # scan per category plus a membership-set rebuild for misc
         scene_names = self._translation_db.scene_names()
-        ciel_scenes = [name for name in scene_names if '_CIEL' in name]
-        arc_scenes = [name for name in scene_names if '_ARC' in name]
-        qa_scenes = [name for name in scene_names if 'QA' in name]
-        misc_scenes = [
-            name for name in scene_names
-            if name not in set(ciel_scenes + arc_scenes + qa_scenes)]
+        ciel_scenes = []
+        arc_scenes = []
+        qa_scenes = []
+        misc_scenes = []
+        for name in scene_names:
+            if '_CIEL' in name:
+                ciel_scenes.append(name)
+            elif '_ARC' in name:
+                arc_scenes.append(name)
+            elif 'QA' in name:
+                qa_scenes.append(name)
+            else:
+                misc_scenes.append(name)
 
         # Create top level categories
         categories = [
@@ -1021,10 +1320,12 @@ class TranslationWindow:
 
         # Helper fun to add arc/ciel scenes, which are by-day
         def insert_day_scene_tree(root, scene_names):
+            # Split each name once and reuse the day fragment for both
+            # the holders and the per-scene placement below
+            day_of = {v: v.split('_', 1)[0] for v in scene_names}
+
             # Create day holders
-            day_names = sorted(list(set([
-                v.split('_')[0] for v in scene_names])))
-            for day in day_names:
+            for day in sorted(set(day_of.values())):
                 self.scene_tree.insert(
                     root,
                     tk.END,
@@ -1034,10 +1335,9 @@ class TranslationWindow:
                 )
 
             # Add arc scenes to appropriate days
-            sorted_scenes = sorted(
-                scene_names, key=cmp_to_key(self.compare_scenes))
+            sorted_scenes = sorted(scene_names, key=self.scene_sort_key)
             for scene in sorted_scenes:
-                scene_day = scene.split('_')[0]
+                scene_day = day_of[scene]
                 self.scene_tree.insert(
                     f"{root}_{scene_day}",
                     tk.END,
@@ -1051,8 +1351,7 @@ class TranslationWindow:
 
         # Helper fun to insert the non-day scenes
         def insert_non_day_scene_tree(root, scene_names):
-            sorted_scenes = sorted(
-                scene_names, key=cmp_to_key(self.compare_scenes))
+            sorted_scenes = sorted(scene_names, key=self.scene_sort_key)
             for scene in sorted_scenes:
                 self.scene_tree.insert(
                     root,
@@ -1065,54 +1364,70 @@ class TranslationWindow:
         insert_non_day_scene_tree('qa', qa_scenes)
         insert_non_day_scene_tree('misc', misc_scenes)
 
-        # Double-click scenes to load
-        # self.scene_tree.bind('<Double-Button-1>', self.load_scene)
-        self.scene_tree.bind('<<TreeviewSelect>>', self.load_scene)
-        self.scene_tree.grid(row=0, column=0, padx=5, pady=5, sticky='nsew')
-        self.scrollbar_scene_tree.grid(row=0, column=1, sticky="ns")
-        self.frame_tree.grid(row = 0, column = 0, sticky = "n")
+        # Remap with the grid options remembered from init
+        self.scene_tree.grid()
 
     def load_scene(self, _event):
+        # Nothing to do if the DB hasn't finished loading
+        if self._translation_db is None:
+            return
+
         # Get the selected scene id
         scene = self.scene_tree.focus()
 
         # If this isn't a real scene (e.g. a day header), do nothing
-        if scene not in self._translation_db.scene_names():
+        if scene not in self._scene_names_set:
             return
 
         # Clear old data from offsets list
         self.listbox_offsets.delete(0, tk.END)
 
-        # Add new entries for each translation offset
+        # Format every row in Python first, then push the lot into the
+        # listbox with a single Tcl call instead of one interpreter
+        # round-trip per line
         scene_lines = self._translation_db.lines_for_scene(scene)
-        idx = 0
-        translated_count = 0
-        for line in scene_lines:
-            modifiers = []
-            if line.has_ruby:
-                modifiers.append('*')
-            if line.is_glued:
-                modifiers.append('+')
-            if line.is_choice:
-                modifiers.append('?')
-            if line.offset in self._translation_db._overrides_by_offset:
-                modifiers.append('offset')
-            self.listbox_offsets.insert(
-                idx,
-                "%03d: %05d %s" % (
-                    line.page_number,
-                    line.offset,
-                    ' '.join(modifiers)
-                )
+        items = []
+        translated_idx = []
+
+        # Bind the loop-invariant lookups to locals; the attribute
+        # chains otherwise cost a dict probe per access per line
+        overrides = self._translation_db._overrides_by_offset
+        translated_hashes = self._translated_hashes
+        modifier_strs = self._MODIFIER_STRS
+        append_item = items.append
+
+        for idx, line in enumerate(scene_lines):
+            bits = (
+                (1 if line.has_ruby else 0)
+                | (2 if line.is_glued else 0)
+                | (4 if line.is_choice else 0)
+                | (8 if line.offset in overrides else 0)
             )
-            tl_info = self._translation_db.tl_line_with_hash(line.jp_hash)
-            if tl_info.en_text:
-                self.listbox_offsets.itemconfig(idx, bg='#BCECC8')
-                translated_count += 1
-            idx += 1
-
-        # Cache the selected scene
+            append_item(
+                f"{line.page_number:03d}: {line.offset:05d} "
+                f"{modifier_strs[bits]}")
+            if line.jp_hash in translated_hashes:
+                translated_idx.append(idx)
+
+        # Detach the scrollbar during the batch so it isn't notified
+        # for intermediate states, then reattach
+        self.listbox_offsets.config(yscrollcommand='')
+        if items:
+            self.listbox_offsets.insert(tk.END, *items)
+        for idx in translated_idx:
+            self.listbox_offsets.itemconfig(idx, bg='#BCECC8')
+        self.listbox_offsets.config(
+            yscrollcommand=self.scrollbar_offsets.set)
+
+        # Cache the selected scene and its line list. The scene map is
+        # immutable (edits live in the hash/offset maps), so the list
+        # stays valid until another scene is loaded.
         self._loaded_scene = scene
+        self._loaded_scene_lines = scene_lines
+
+        # Selecting a new scene invalidates the displayed line, so the
+        # same index in the fresh list must not be treated as a re-click
+        self._loaded_offset = None
 
         # Update current day translated percent
         self.update_global_tl_percent()
@@ -1126,20 +1441,25 @@ class TranslationWindow:
             return
 
         # Check the active scene is valid
-        if self._loaded_scene not in self._translation_db.scene_names():
+        if self._loaded_scene not in self._scene_names_set:
+            return
+
+        # Nothing to do if the same line is already displayed — skip
+        # the six delete/insert round-trips on redundant select events
+        if selected_indexes[0] == self._loaded_offset:
             return
 
         # Cache the offset
         self._loaded_offset = selected_indexes[0]
 
-        # Load the relevant line info from the scene
-        scene_lines = self._translation_db.lines_for_scene(self._loaded_scene)
+        # Load the relevant line info from the cached scene list
+        scene_lines = self._loaded_scene_lines
         selected_line = scene_lines[self._loaded_offset]
 
         # Get the translation data for this JP hash or offset
         offset = selected_line.offset
         jp_hash = selected_line.jp_hash
-        text_by_hash = self._translation_db.tl_line_with_hash(jp_hash)
+        text_by_hash = self._tl_line_cached(jp_hash)
         text_for_sha = f"Text for sha:\n{text_by_hash.en_text}\n" if text_by_hash.en_text else ""
         comment_for_sha = f"Comment for sha:\n{text_by_hash.comment}\n" if text_by_hash.comment else ""
         tl_info = self._translation_db.tl_line_for_cmd(selected_line)
@@ -1154,8 +1474,10 @@ class TranslationWindow:
             self.text_orig.insert("1.0", f"{tl_info.jp_text}\n"
                 f"{sha_count} sha: {jp_hash} offset: {offset}\n"
                 f"{text_for_sha}{comment_for_sha}"
-                f"{sha_count} entries appears in:\n"
-                f"{chr(10).join(map(' offset: '.join, names_offsets))}")
+                f"{sha_count} entries appears in:\n" +
+                "\n".join(
+                    f"{name} offset: {offset}"
+                    for name, offset in names_offsets))
             self.text_translated.insert("1.0", tl_info.en_text or "")
             self.text_comment.insert("1.0", tl_info.comment or "")
 
@@ -1246,15 +1568,20 @@ class TranslationWindow:
         )
 
     def find_sha_lines(self, sha):
-        scenes = self._translation_db._scene_map
-        sha_count = 0
-        names_offsets = []
-        for name, commands in scenes.items():
-            for command in range(len(commands)):
-                if commands[command].jp_hash == sha:
-                    names_offsets.append([name, str(commands[command].offset)])
-                    sha_count += 1
-        return (sha_count, names_offsets)
+        # Index built lazily on the first lookup: one pass over the
+        # scene map, then every later query is a dict probe. The scene
+        # map never changes while the editor is open, so the index
+        # never needs invalidating.
+        if self._sha_index is None:
+            index = {}
+            for name, commands in self._translation_db._scene_map.items():
+                for command in commands:
+                    index.setdefault(command.jp_hash, []).append(
+                        (name, command.offset))
+            self._sha_index = index
+
+        entries = self._sha_index.get(sha, ())
+        return (len(entries), entries)
 
     def on_keyevent(self, event):
         # Ctrl-C exits
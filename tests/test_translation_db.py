@@ -3,6 +3,12 @@ from collections import defaultdict
 
 from luna.translation_db import TranslationDb
 
+# Shared parse inputs: every key maps to the same constant line / hash,
+# so one pair of defaultdicts serves all tests instead of rebuilding
+# them per call
+_TL_LINES = defaultdict(lambda: TranslationDb.TLLine('a jp string'))
+_CONTENT_HASHES = defaultdict(lambda: 'a content hash')
+
 
 class LinebreakTests(unittest.TestCase):
 
@@ -13,8 +19,8 @@ class LinebreakTests(unittest.TestCase):
     def assert_parse_match(self, test_cmds, expected_output):
         cmds = TranslationDb.parse_script_cmds(
             test_cmds.encode('utf-8'),
-            defaultdict(lambda: TranslationDb.TLLine('a jp string')),
-            defaultdict(lambda: 'a content hash')
+            _TL_LINES,
+            _CONTENT_HASHES
         )
         self.assertEqual(cmds, expected_output)
 